@@ -11,18 +11,120 @@ it gets weird...
 
 import praw
 import re
+import functools
+import heapq
+import io
+import sqlite3
 import click
 import os
 import sys
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Iterator, Tuple, Optional, Type
+from dataclasses import dataclass, field
 from pathlib import Path
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Markdown for _clean_text, stripped by separate passes in this order, each
+# skipped when its marker is absent. A single leftmost-first alternation would
+# let e.g. a stray '*' (as in '5*3') pair up with the next emphasis marker.
+_MARKDOWN_PASSES = (
+    ('**', re.compile(r'\*\*(.+?)\*\*')),  # Bold
+    ('*', re.compile(r'\*(.+?)\*')),       # Italic
+    ('~~', re.compile(r'~~(.+?)~~')),      # Strikethrough
+    ('^', re.compile(r'\^(.+?)')),         # Superscript
+    ('`', re.compile(r'`(.+?)`')),         # Code
+)
+
+# Single-pass removal of everything else _clean_text drops
+_CLEAN_RE = re.compile(
+    r'^\s*&gt;.*$'                                  # Quotes
+    r'|https?://\S+'                                # URLs
+    r'|/?[ur]/(?:(?!https?://)\w)+'                 # User/subreddit references (not into a URL)
+    r'|\s*(?i:edit):.*$',                           # Edit markers
+    re.MULTILINE,
+)
+
+# Substrings at least one of which any _CLEAN_RE match must contain
+_CLEAN_MARKERS = ('&gt;', '/', ':')
+
+
+def _has_clean_marker(text: str) -> bool:
+    """Check whether _CLEAN_RE could match anything in the text."""
+    # A plain loop of substring checks beats both any() over a generator and a
+    # multi-pattern matcher (regex character class, Aho-Corasick) on short text
+    for marker in _CLEAN_MARKERS:
+        if marker in text:
+            return True
+    return False
+
+
+def _clean_text_uncached(text: str) -> str:
+    """
+    Clean Reddit text for Character.AI format.
+
+    >>> _clean_text_uncached('5*3 and **hi**')
+    '5*3 and hi'
+    >>> _clean_text_uncached('***both***')
+    'both'
+    >>> _clean_text_uncached('**bold *nested***')
+    'bold nested'
+    >>> _clean_text_uncached('**a*b**')
+    'a*b'
+    >>> _clean_text_uncached('~~*not* it~~')
+    'not it'
+    >>> _clean_text_uncached('u/bobhttp://a.b/c and r/xhttps://x.y/z')
+    'and'
+    """
+    if not text:
+        return ""
+
+    # Remove Reddit formatting
+    for marker, pattern in _MARKDOWN_PASSES:
+        if marker in text:
+            text = pattern.sub(r'\1', text)
+
+    # Remove quotes, URLs, references and edit markers. Plenty of comments have
+    # none of these, and substring checks are much cheaper than the regex.
+    if _has_clean_marker(text):
+        text = _CLEAN_RE.sub('', text)
+
+    # Clean up whitespace: collapse runs of spaces/tabs within each line and
+    # allow at most one blank line in a row (plain str ops beat two more regex
+    # passes on comment-sized text)
+    lines = []
+    for line in text.split('\n'):
+        line = ' '.join(line.split())
+        if line or (lines and lines[-1]):
+            lines.append(line)
+
+    return '\n'.join(lines).strip()
+
+
+_clean_text_cached = functools.lru_cache(maxsize=1024)(_clean_text_uncached)
+
+
+def _clean_text(text: str) -> str:
+    """Clean Reddit text, memoized since one post or comment is often replied to several times."""
+    # Don't let unusually long texts take up the cache
+    if len(text) > 4096:
+        return _clean_text_uncached(text)
+    return _clean_text_cached(text)
+
+
+# What to report when generate_character_definition returns None for a user
+_NO_CONVERSATIONS_MESSAGE = "No suitable conversations found for u/{}. The user might have no public activity or all comments are too short/long."
+
+# Placeholders for the people the character replies to, cycled through for variety
+_USER_PLACEHOLDERS = tuple(f"{{{{random_user_{i}}}}}" for i in range(1, 6))
+
+# Characters format_for_character_ai adds around the two texts (the user
+# placeholders are all the same length)
+_FORMAT_OVERHEAD = len(_USER_PLACEHOLDERS[0]) + len(": \n{{char}}: \n\n")
+
 
 @dataclass
 class Conversation:
@@ -31,65 +133,87 @@ class Conversation:
     reply_text: str
     score: int
     length: int
+    original_clean: str = field(init=False, repr=False)
+    reply_clean: str = field(init=False, repr=False)
+    formatted_length: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Clean once here rather than on every format
+        self.original_clean = _clean_text(self.original_text)
+        self.reply_clean = _clean_text(self.reply_text)
+        self.formatted_length = _FORMAT_OVERHEAD + len(self.original_clean) + len(self.reply_clean)
 
     def format_for_character_ai(self, user_placeholder: str) -> str:
         """Format the conversation for Character.AI definition."""
-        # Clean up the text
-        original_clean = self._clean_text(self.original_text)
-        reply_clean = self._clean_text(self.reply_text)
-
-        # Format as dialog
-        return f"{user_placeholder}: {original_clean}\n{{{{char}}}}: {reply_clean}\n\n"
-
-    def _clean_text(self, text: str) -> str:
-        """Clean Reddit text for Character.AI format."""
-        if not text:
-            return ""
-
-        # Remove Reddit formatting
-        text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)  # Bold
-        text = re.sub(r'\*(.+?)\*', r'\1', text)      # Italic
-        text = re.sub(r'~~(.+?)~~', r'\1', text)      # Strikethrough
-        text = re.sub(r'\^(.+?)', r'\1', text)        # Superscript
-        text = re.sub(r'`(.+?)`', r'\1', text)        # Code
-
-        # Remove quotes and references
-        text = re.sub(r'^&gt;.*$', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^\s*&gt;.*$', '', text, flags=re.MULTILINE)
-
-        # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+        return "".join((user_placeholder, ": ", self.original_clean, "\n{{char}}: ", self.reply_clean, "\n\n"))
 
-        # Remove Reddit user references
-        text = re.sub(r'/u/\w+', '', text)
-        text = re.sub(r'u/\w+', '', text)
-        text = re.sub(r'/r/\w+', '', text)
-        text = re.sub(r'r/\w+', '', text)
 
-        # Clean up whitespace
-        text = re.sub(r'\n\s*\n\s*\n', '\n\n', text)  # Multiple newlines
-        text = re.sub(r'[ \t]+', ' ', text)           # Multiple spaces
-        text = text.strip()
+class ParentTextCache:
+    """
+    On-disk SQLite cache of the text each comment replied to, keyed by comment ID.
 
-        # Remove edit markers
-        text = re.sub(r'\s*EDIT:.*$', '', text, flags=re.IGNORECASE | re.MULTILINE)
-        text = re.sub(r'\s*Edit:.*$', '', text, flags=re.IGNORECASE | re.MULTILINE)
+    An entry only counts while the comment's edited timestamp still matches, so
+    editing a comment invalidates it.
+    """
 
-        return text
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(path))
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS parent_texts (id TEXT PRIMARY KEY, edited REAL, parent_text TEXT)"
+        )
+
+    def close(self):
+        self.connection.close()
+
+    def get(self, comments: List) -> Dict[str, str]:
+        """Return the cached parent texts of the given comments, keyed by comment ID."""
+        edited_by_id = {comment.id: float(comment.edited or 0) for comment in comments}
+        ids = list(edited_by_id)
+
+        parent_texts = {}
+        # Stay under SQLite's limit on bound parameters per statement
+        for start in range(0, len(ids), 500):
+            batch = ids[start:start + 500]
+            rows = self.connection.execute(
+                f"SELECT id, edited, parent_text FROM parent_texts WHERE id IN ({','.join('?' * len(batch))})",
+                batch,
+            )
+            for comment_id, edited, parent_text in rows:
+                if edited == edited_by_id[comment_id]:
+                    parent_texts[comment_id] = parent_text
+
+        return parent_texts
+
+    def put(self, comments: List, parent_texts: Dict[str, str]):
+        """Cache the given comments' parent texts, as keyed by parent fullname."""
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO parent_texts (id, edited, parent_text) VALUES (?, ?, ?)",
+            [(comment.id, float(comment.edited or 0), parent_texts[comment.parent_id])
+             for comment in comments if comment.parent_id in parent_texts],
+        )
+        self.connection.commit()
 
 
 class CharacterGenerator:
     """Generates Character.AI definitions from Reddit user data."""
 
-    def __init__(self, reddit_instance: praw.Reddit):
+    _INTRO_TEMPLATE = "This character is based on the Reddit user u/{}. Here are examples of how they typically respond:\n\n"
+
+    cache_path = Path.home() / ".cache" / "reddit_character_ai" / "parent_texts.sqlite3"
+
+    def __init__(self, reddit_instance: praw.Reddit, use_cache: bool = True):
         self.reddit = reddit_instance
+        self.use_cache = use_cache
         self.max_definition_length = 32000
         self.max_single_conversation_length = 800  # Leave room for multiple conversations
         self.min_comment_length = 10
         self.max_comment_length = 300
+        self.max_conversations = self.max_definition_length // 100  # Stop reading comments once there are plenty
+        self.parent_batch_size = 100  # Replies to fetch parents for at once, a listing page's worth
 
-    def generate_character_definition(self, username: str, limit: int = 100) -> str:
-        """Generate a Character.AI definition from a Reddit user's activity."""
+    def generate_character_definition(self, username: str, limit: int = 100) -> Optional[str]:
+        """Generate a Character.AI definition from a Reddit user's activity, or None if there's nothing to base it on."""
         logger.info(f"Generating character definition for u/{username}")
 
         try:
@@ -97,12 +221,15 @@ class CharacterGenerator:
             conversations = self._extract_conversations(user, limit)
 
             if not conversations:
-                return f"No suitable conversations found for u/{username}. The user might have no public activity or all comments are too short/long."
+                return None
 
             logger.info(f"Found {len(conversations)} suitable conversations")
 
-            # Sort by score (engagement) and length for better quality
-            conversations.sort(key=lambda x: (x.score, -x.length), reverse=True)
+            # Sort by score (engagement) and length for better quality. Every formatted
+            # conversation is at least _FORMAT_OVERHEAD long, so no more than this many
+            # can fit in the definition and there's no need to sort the rest.
+            max_fitting = self.max_definition_length // _FORMAT_OVERHEAD
+            conversations = heapq.nlargest(max_fitting, conversations, key=lambda x: (x.score, -x.length))
 
             definition = self._build_definition(conversations, username)
 
@@ -116,98 +243,238 @@ class CharacterGenerator:
     def _extract_conversations(self, user: praw.models.Redditor, limit: int) -> List[Conversation]:
         """Extract conversation pairs from user's comments."""
         conversations = []
+        cache = self._open_cache()
 
         try:
-            # Get user's comments
-            comments = list(user.comments.new(limit=limit))
-            logger.info(f"Processing {len(comments)} comments")
+            # Stream the user's comments, dropping unusable replies before fetching
+            # anything they replied to. Parents are fetched in batches as replies come
+            # in, so reading can stop once there are enough conversations.
+            candidates = []
+            processed = 0
+            total_length = 0
+            for comment in self._fetch_comments(user, limit):
+                processed += 1
+
+                # Skip deleted/removed comments
+                if not comment.body or comment.body in ['[deleted]', '[removed]']:
+                    continue
 
-            for comment in comments:
-                try:
-                    # Skip deleted/removed comments
-                    if not comment.body or comment.body in ['[deleted]', '[removed]']:
-                        continue
-
-                    # Filter by length
-                    if len(comment.body) < self.min_comment_length or len(comment.body) > self.max_comment_length:
-                        continue
-
-                    # Get what they were replying to
-                    parent = None
-                    if comment.is_root:
-                        # Reply to a post
-                        parent = comment.submission
-                        parent_text = parent.title
-                        if parent.selftext and len(parent.selftext) < self.max_comment_length:
-                            parent_text += f"\n{parent.selftext}"
-                    else:
-                        # Reply to another comment
-                        parent = comment.parent()
-                        if hasattr(parent, 'body'):
-                            parent_text = parent.body
-                        else:
-                            continue
-
-                    # Skip if parent is too long or short
-                    if not parent_text or len(parent_text) < self.min_comment_length or len(parent_text) > self.max_comment_length:
-                        continue
-
-                    # Create conversation
-                    conv = Conversation(
-                        original_text=parent_text,
-                        reply_text=comment.body,
-                        score=max(comment.score, 0),
-                        length=len(parent_text) + len(comment.body)
-                    )
-
-                    # Check if the formatted conversation would be too long
-                    formatted_length = len(conv.format_for_character_ai("{{random_user_1}}"))
-                    if formatted_length <= self.max_single_conversation_length:
-                        conversations.append(conv)
+                # Filter by length
+                if len(comment.body) < self.min_comment_length or len(comment.body) > self.max_comment_length:
+                    continue
 
-                except Exception as e:
-                    logger.debug(f"Error processing comment: {e}")
+                candidates.append(comment)
+                if len(candidates) < self.parent_batch_size:
                     continue
 
+                new_conversations = self._conversations_for(candidates, cache)
+                conversations.extend(new_conversations)
+                total_length += sum(conv.formatted_length for conv in new_conversations)
+                candidates = []
+
+                # Enough to fill the definition, with plenty to choose the best from
+                if len(conversations) >= self.max_conversations and total_length >= self.max_definition_length:
+                    break
+
+            if candidates:
+                conversations.extend(self._conversations_for(candidates, cache))
+
+            logger.info(f"Processed {processed} comments into {len(conversations)} conversations")
+
         except Exception as e:
             logger.error(f"Error accessing user comments: {e}")
 
+        finally:
+            if cache:
+                cache.close()
+
+        return conversations
+
+    def _conversations_for(self, comments: List, cache: Optional[ParentTextCache]) -> List[Conversation]:
+        """Turn usable replies into conversations with what they replied to, dropping any that don't fit."""
+        conversations = []
+
+        # Get what they were replying to: from the cache for comments we've seen
+        # before, otherwise in as few requests as possible. The cache is only an
+        # optimization, so errors using it (e.g. a database locked by another
+        # worker) just mean going without.
+        cached_parent_texts = {}
+        if cache:
+            try:
+                cached_parent_texts = cache.get(comments)
+            except sqlite3.Error as e:
+                logger.warning(f"Couldn't read parent text cache at {self.cache_path}: {e}")
+
+        uncached = [comment for comment in comments if comment.id not in cached_parent_texts]
+        logger.debug(f"{len(cached_parent_texts)} parent texts cached, fetching {len(uncached)}")
+        parent_texts = self._fetch_parent_texts(uncached)
+
+        if cache:
+            try:
+                cache.put(uncached, parent_texts)
+            except sqlite3.Error as e:
+                logger.warning(f"Couldn't update parent text cache at {self.cache_path}: {e}")
+
+        for comment in comments:
+            try:
+                if comment.id in cached_parent_texts:
+                    parent_text = cached_parent_texts[comment.id]
+                else:
+                    parent_text = parent_texts.get(comment.parent_id)
+
+                # Skip if parent is too long or short
+                if not parent_text or len(parent_text) < self.min_comment_length or len(parent_text) > self.max_comment_length:
+                    continue
+
+                # Create conversation
+                conv = Conversation(
+                    original_text=parent_text,
+                    reply_text=comment.body,
+                    score=max(comment.score, 0),
+                    length=len(parent_text) + len(comment.body)
+                )
+
+                # Check if the formatted conversation would be too long
+                if conv.formatted_length <= self.max_single_conversation_length:
+                    conversations.append(conv)
+
+            except Exception as e:
+                logger.debug(f"Error processing comment: {e}")
+                continue
+
         return conversations
 
+    def _open_cache(self) -> Optional[ParentTextCache]:
+        """Open the parent text cache, or return None if it's disabled or unavailable."""
+        if not self.use_cache:
+            return None
+
+        try:
+            return ParentTextCache(self.cache_path)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Not using parent text cache at {self.cache_path}: {e}")
+            return None
+
+    def _fetch_comments(self, user: praw.models.Redditor, limit: int) -> Iterator[praw.models.Comment]:
+        """Lazily fetch the user's most recent comments, one listing page at a time."""
+        return user.comments.new(limit=limit)
+
+    def _fetch_parent_texts(self, comments: List[praw.models.Comment]) -> Dict[str, str]:
+        """Fetch the text of the posts/comments that the given comments replied to, keyed by fullname.
+
+        Uses reddit.info(), which asks for up to 100 fullnames per request, rather
+        than letting comment.parent()/comment.submission lazy-load one at a time.
+        """
+        fullnames = list(dict.fromkeys(comment.parent_id for comment in comments))
+        if not fullnames:
+            return {}
+
+        parent_texts = {}
+        for parent in self.reddit.info(fullnames=fullnames):
+            if isinstance(parent, praw.models.Submission):
+                # Reply to a post
+                parent_text = parent.title
+                if parent.selftext and len(parent.selftext) < self.max_comment_length:
+                    parent_text += f"\n{parent.selftext}"
+            else:
+                # Reply to another comment
+                parent_text = parent.body
+            parent_texts[parent.fullname] = parent_text
+
+        logger.debug(f"Fetched {len(parent_texts)} of {len(fullnames)} parent posts/comments")
+        return parent_texts
+
     def _build_definition(self, conversations: List[Conversation], username: str) -> str:
         """Build the final Character.AI definition from conversations."""
-        definition_parts = []
-        current_length = 0
-        user_counter = 1
+        buf = io.StringIO()
 
         # Add a brief intro
-        intro = f"This character is based on the Reddit user u/{username}. Here are examples of how they typically respond:\n\n"
-        definition_parts.append(intro)
-        current_length += len(intro)
-
-        for conv in conversations:
-            # Use different user placeholders for variety
-            user_placeholder = f"{{{{random_user_{user_counter}}}}}"
-            formatted_conv = conv.format_for_character_ai(user_placeholder)
+        buf.write(self._INTRO_TEMPLATE.format(username))
 
+        for i, conv in enumerate(conversations):
             # Check if adding this conversation would exceed the limit
-            if current_length + len(formatted_conv) > self.max_definition_length:
+            if buf.tell() + conv.formatted_length > self.max_definition_length:
                 break
 
-            definition_parts.append(formatted_conv)
-            current_length += len(formatted_conv)
+            # Cycle through user placeholders for variety
+            user_placeholder = _USER_PLACEHOLDERS[i % len(_USER_PLACEHOLDERS)]
+            buf.write(conv.format_for_character_ai(user_placeholder))
 
-            # Cycle through user placeholders (1-5 for variety)
-            user_counter = (user_counter % 5) + 1
+        return buf.getvalue()
 
-        definition = "".join(definition_parts)
 
+@dataclass
+class ListingComment:
+    """The parts of a comment that FastCharacterGenerator reads from a raw JSON listing."""
+    id: str
+    body: str
+    score: int
+    parent_id: str
+    link_title: str
+    edited: float
+
+    @property
+    def is_root(self) -> bool:
+        return self.parent_id.startswith('t3_')
+
+    @classmethod
+    def from_json(cls, data: Dict) -> 'ListingComment':
+        return cls(
+            id=data['id'],
+            body=data.get('body', ''),
+            score=data.get('score', 0),
+            parent_id=data['parent_id'],
+            link_title=data.get('link_title', ''),
+            edited=float(data.get('edited') or 0),
+        )
+
+
+class FastCharacterGenerator(CharacterGenerator):
+    """
+    CharacterGenerator that reads Reddit's JSON listings directly instead of going through PRAW models.
 
-        return definition
+    Replies to posts use the post title that comes with each comment in the listing, so posts
+    are never fetched (at the cost of leaving out their selftext). Parent comments are still
+    fetched 100 at a time from /api/info.
+    """
 
+    # Replies to posts only get the title here, so don't mix them with CharacterGenerator's cache
+    cache_path = CharacterGenerator.cache_path.with_name("parent_texts_fast.sqlite3")
 
-def setup_reddit_client() -> praw.Reddit:
-    """Initialize PRAW Reddit client with config from praw.ini."""
+    def _fetch_comments(self, user: praw.models.Redditor, limit: int) -> Iterator[ListingComment]:
+        """Lazily fetch the user's most recent comments, 100 per listing page."""
+        fetched = 0
+        params = {'sort': 'new'}
+
+        while fetched < limit:
+            params['limit'] = min(100, limit - fetched)
+            listing = self.reddit.request(method='GET', path=f'user/{user.name}/comments', params=params)
+            children = listing['data']['children']
+            for child in children:
+                yield ListingComment.from_json(child['data'])
+            fetched += len(children)
+
+            after = listing['data'].get('after')
+            if not children or not after:
+                break
+            params['after'] = after
+
+    def _fetch_parent_texts(self, comments: List[ListingComment]) -> Dict[str, str]:
+        """Get the text of the posts/comments that the given comments replied to, keyed by fullname."""
+        parent_texts = {comment.parent_id: comment.link_title for comment in comments if comment.is_root}
+
+        fullnames = list(dict.fromkeys(comment.parent_id for comment in comments if not comment.is_root))
+        for start in range(0, len(fullnames), 100):
+            listing = self.reddit.request(method='GET', path='api/info',
+                                          params={'id': ','.join(fullnames[start:start + 100])})
+            for child in listing['data']['children']:
+                parent_texts[child['data']['name']] = child['data'].get('body', '')
+
+        return parent_texts
+
+
+def find_praw_config() -> Path:
+    """Find praw.ini, exiting with setup instructions if there isn't one."""
     # Look for praw.ini in multiple locations (in order of preference)
     possible_paths = [
         Path.home() / ".config" / "praw.ini",  # XDG config directory
@@ -215,29 +482,37 @@ def setup_reddit_client() -> praw.Reddit:
         Path.home() / "reddit_credentials" / "praw.ini",  # Dedicated folder
     ]
 
-    config_path = None
     for path in possible_paths:
         if path.exists():
-            config_path = path
-            logger.info(f"Using praw.ini from: {config_path}")
-            break
-
-    if not config_path:
-        logger.error("praw.ini not found in any of these locations:")
-        for path in possible_paths:
-            logger.error(f"  - {path}")
-        logger.error("")
-        logger.error("Recommended setup:")
-        logger.error("1. Create directory: mkdir -p ~/.config")
-        logger.error("2. Copy template: cp praw.ini.template ~/.config/praw.ini")
-        logger.error("3. Edit ~/.config/praw.ini with your Reddit API credentials")
-        logger.error("4. Get credentials from https://www.reddit.com/prefs/apps/")
-        sys.exit(1)
+            logger.info(f"Using praw.ini from: {path}")
+            return path
+
+    logger.error("praw.ini not found in any of these locations:")
+    for path in possible_paths:
+        logger.error(f"  - {path}")
+    logger.error("")
+    logger.error("Recommended setup:")
+    logger.error("1. Create directory: mkdir -p ~/.config")
+    logger.error("2. Copy template: cp praw.ini.template ~/.config/praw.ini")
+    logger.error("3. Edit ~/.config/praw.ini with your Reddit API credentials")
+    logger.error("4. Get credentials from https://www.reddit.com/prefs/apps/")
+    sys.exit(1)
+
+
+def create_reddit_client(config_path: Path) -> praw.Reddit:
+    """Create a PRAW Reddit client from praw.ini without checking that it can authenticate."""
+    return praw.Reddit(config_interpolation="basic",
+                       praw_config_file=str(config_path),
+                       site_name="reddit_character_ai_config")
+
+
+def setup_reddit_client(config_path: Optional[Path] = None) -> praw.Reddit:
+    """Initialize PRAW Reddit client with config from praw.ini."""
+    if config_path is None:
+        config_path = find_praw_config()
 
     try:
-        reddit = praw.Reddit(config_interpolation="basic",
-                           praw_config_file=str(config_path),
-                           site_name="reddit_character_ai_config")
+        reddit = create_reddit_client(config_path)
         # Test the connection
         reddit.user.me()  # This will fail if not properly authenticated
         return reddit
@@ -247,40 +522,103 @@ def setup_reddit_client() -> praw.Reddit:
         sys.exit(1)
 
 
+def generate_for_users(usernames: List[str], limit: int, output_dir: Path, max_workers: int = 8,
+                       generator_class: Type[CharacterGenerator] = CharacterGenerator, use_cache: bool = True) -> bool:
+    """
+    Generate definitions for several users concurrently, saving each to <output_dir>/<username>.txt.
+
+    Returns True if every user's definition was generated.
+    """
+    config_path = find_praw_config()
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Check the credentials once, up front, so workers don't each exit the whole
+    # process over them (or each spend a request on it)
+    setup_reddit_client(config_path)
+
+    def generate(username: str) -> Optional[str]:
+        # praw.Reddit isn't thread-safe, so each worker gets its own session.
+        # They all share the same credentials, and therefore the same rate limit.
+        generator = generator_class(create_reddit_client(config_path), use_cache=use_cache)
+        return generator.generate_character_definition(username, limit)
+
+    all_succeeded = True
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(generate, username): username for username in usernames}
+        try:
+            for future in as_completed(futures):
+                username = futures[future]
+                try:
+                    definition = future.result()
+                except Exception as e:
+                    click.echo(f"❌ Error for u/{username}: {e}", err=True)
+                    all_succeeded = False
+                    continue
+
+                if not definition:
+                    click.echo(f"❌ {_NO_CONVERSATIONS_MESSAGE.format(username)}", err=True)
+                    all_succeeded = False
+                    continue
+
+                output_path = output_dir / f"{username}.txt"
+                output_path.write_text(definition, encoding='utf-8')
+                click.echo(f"✅ u/{username}: saved to {output_path} ({len(definition)}/32000 characters)")
+        except BaseException:
+            # On Ctrl-C etc., don't let leaving the with block wait for every queued
+            # user to be generated (shutdown(cancel_futures=True) needs Python 3.9+)
+            for future in futures:
+                future.cancel()
+            raise
+
+    return all_succeeded
+
+
 @click.command()
-@click.argument('username')
-@click.option('--limit', '-l', default=100, help='Number of recent comments to analyze (default: 100)')
-@click.option('--output', '-o', help='Output file path (default: stdout)')
+@click.argument('usernames', nargs=-1, required=True)
+@click.option('--limit', '-l', default=100, help='Maximum number of recent comments to analyze; stops early once there are enough conversations (default: 100)')
+@click.option('--output', '-o', help='Output file path (default: stdout), or output directory when given several users (default: current directory)')
+@click.option('--workers', '-w', default=8, type=click.IntRange(min=1), help='Number of users to fetch concurrently when given several (default: 8)')
+@click.option('--fast', is_flag=True, help="Read Reddit's JSON listings directly; replies to posts only see the post title")
+@click.option('--no-cache', is_flag=True, help="Don't read or write the on-disk cache of what comments replied to")
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
-def main(username: str, limit: int, output: str, verbose: bool):
+def main(usernames: Tuple[str, ...], limit: int, output: str, workers: int, fast: bool, no_cache: bool, verbose: bool):
     """
     Generate a Character.AI character definition from a Reddit user's posts and comments.
 
-    USERNAME: The Reddit username to analyze (without the u/ prefix)
+    USERNAMES: The Reddit username(s) to analyze (without the u/ prefix)
 
     Example:
         python reddit_character_ai_config.py someuser
         python reddit_character_ai_config.py someuser --limit 200 --output character_def.txt
+        python reddit_character_ai_config.py someuser otheruser --output definitions/
     """
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
     # Remove u/ prefix if present
-    if username.startswith('u/'):
-        username = username[2:]
+    usernames = [username[2:] if username.startswith('u/') else username for username in usernames]
 
-    click.echo(f"🤖 Generating Character.AI definition for u/{username}")
+    generator_class = FastCharacterGenerator if fast else CharacterGenerator
 
     try:
+        if len(usernames) > 1:
+            click.echo(f"🤖 Generating Character.AI definitions for {len(usernames)} users")
+            if not generate_for_users(usernames, limit, Path(output or '.'), workers, generator_class, not no_cache):
+                sys.exit(1)
+            return
+
+        username = usernames[0]
+        click.echo(f"🤖 Generating Character.AI definition for u/{username}")
+
         # Setup Reddit client
         reddit = setup_reddit_client()
 
         # Generate character definition
-        generator = CharacterGenerator(reddit)
+        generator = generator_class(reddit, use_cache=not no_cache)
         definition = generator.generate_character_definition(username, limit)
 
         if not definition:
-            click.echo("❌ No suitable content found for this user", err=True)
+            click.echo(f"❌ {_NO_CONVERSATIONS_MESSAGE.format(username)}", err=True)
             sys.exit(1)
 
         # Output the definition